@@ -8,12 +8,24 @@ curr_dir = os.path.dirname(os.path.realpath(__file__))
 
 DIGITS = 5
 
+# only the columns below are used to build the case, so skip parsing the rest
+GEN_COLUMNS = [
+    'GEN UID', 'Bus ID', 'Unit Type', 'Fuel', 'MW Inj', 'MVAR Inj', 'V Setpoint p.u.', 'PMax MW', 'PMin MW', 'QMax MVAR',
+    'QMin MVAR', 'Ramp Rate MW/Min', 'Start Heat Cold MMBTU', 'Non Fuel Start Cost $', 'Fuel Price $/MMBTU',
+    'Output_pct_0', 'Output_pct_1', 'Output_pct_2', 'Output_pct_3', 'HR_avg_0', 'HR_incr_1', 'HR_incr_2', 'HR_incr_3'
+]
+BUS_COLUMNS = [
+    'Bus ID', 'Bus Name', 'BaseKV', 'Bus Type', 'MW Load', 'MVAR Load', 'V Mag', 'V Angle', 'MW Shunt G',
+    'MVAR Shunt B', 'Area', 'Zone'
+]
+BRANCH_COLUMNS = ['From Bus', 'To Bus', 'R', 'X', 'B', 'Cont Rating', 'Tr Ratio']
+
 
 def create_rts_MATPOWER_file(folder):
 
-    _generators = pd.read_csv(os.path.join(folder, 'gen.csv'))
-    buses = pd.read_csv(os.path.join(folder, 'bus.csv'))
-    branchdata = pd.read_csv(os.path.join(folder, 'branch.csv'))
+    _generators = pd.read_csv(os.path.join(folder, 'gen.csv'), usecols=GEN_COLUMNS)
+    buses = pd.read_csv(os.path.join(folder, 'bus.csv'), usecols=BUS_COLUMNS)
+    branchdata = pd.read_csv(os.path.join(folder, 'branch.csv'), usecols=BRANCH_COLUMNS)
 
     pivot_heat_rate = pd.DataFrame(
         _generators[[
@@ -93,7 +105,7 @@ mpc.areas = [
 mpc.bus = [''')
 
     bus = dict()
-    for i, b in buses.iterrows():
+    for b in buses.to_dict(orient="records"):
         bus['bus_i'] = b['Bus ID']
         if b['Bus Type'] == 'PQ':
             bus['type'] = 1
@@ -131,7 +143,7 @@ mpc.gen = ['''
 
     gen = dict()
 
-    for i, g in _generators.iterrows():
+    for g in _generators.to_dict(orient="records"):
         gen['bus'] = g['Bus ID']
         gen['Pg'] = g['MW Inj']
         gen['Qg'] = g['MVAR Inj']
@@ -172,7 +184,7 @@ mpc.branch = [''')
 
     branch = dict()
 
-    for i, b in branchdata.iterrows():
+    for b in branchdata.to_dict(orient="records"):
         branch['fbus'] = int(b['From Bus'])
         branch['tbus'] = int(b['To Bus'])
         branch['r'] = b['R']
@@ -206,7 +218,7 @@ mpc.gencost = ['''
 
     gen = dict()
 
-    for i, g in _generators.iterrows():
+    for g in _generators.to_dict(orient="records"):
         gen['model'] = 1
         gen['startup'] = (
             (g['Start Heat Cold MMBTU'] * g['Fuel Price $/MMBTU']) + g['Non Fuel Start Cost $']
@@ -244,7 +256,7 @@ mpc.gencost = ['''
 %column_names%	name
 mpc.bus_name = {''')
     bn = dict()
-    for i, b in buses.iterrows():
+    for b in buses.to_dict(orient="records"):
         bn['bn'] = "\t'{:}'".format(b['Bus Name']).upper()
         l('''{bn};'''.format(**bn))
 
@@ -256,7 +268,7 @@ mpc.bus_name = {''')
 %column_names%	name    type    fuel
 mpc.gen_name = {''')
     gn = dict()
-    for i, g in _generators.iterrows():
+    for g in _generators.to_dict(orient="records"):
         gn['gn'] = "\t'{:}'".format(g['GEN UID']).upper()
         gn['type'] = "'{:}'".format(g['Unit Type'])
         gn['fuel'] = "'{:}'".format(g['Fuel'])
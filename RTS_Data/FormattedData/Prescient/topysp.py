@@ -95,8 +95,7 @@ bus_df = pd.read_table("bus.csv", header=0, sep=',')
 branch_df = pd.read_table("branch.csv", header=0, sep=',')
 timeseries_pointer_df = pd.read_table("timeseries_pointers.csv", header=0, sep=',')
 
-for generator_index in generator_df.index.tolist():
-    this_generator_dict = generator_df.loc[generator_index].to_dict()
+for this_generator_dict in generator_df.to_dict(orient="records"):
     new_generator = Generator(this_generator_dict["GEN UID"],
                               int(this_generator_dict["Bus ID"]),
                               this_generator_dict["Unit Group"],
@@ -128,8 +127,7 @@ for generator_index in generator_df.index.tolist():
 
 bus_id_to_name_dict = {}
 
-for bus_index in bus_df.index.tolist():
-    this_bus_dict = bus_df.loc[bus_index].to_dict()
+for this_bus_dict in bus_df.to_dict(orient="records"):
     new_bus = Bus(int(this_bus_dict["Bus ID"]),
                   this_bus_dict["Bus Name"],
                   this_bus_dict["BaseKV"],
@@ -158,8 +156,7 @@ bus_load_participation_factor_dict = {}
 for bus_name, bus_spec in bus_dict.items():
     bus_load_participation_factor_dict[bus_name] = bus_spec.MWLoad / region_total_load[bus_spec.Area]
 
-for branch_index in branch_df.index.tolist():
-    this_branch_dict = branch_df.loc[branch_index].to_dict()
+for this_branch_dict in branch_df.to_dict(orient="records"):
     new_branch = Branch(this_branch_dict["UID"],
                         this_branch_dict["From Bus"],
                         this_branch_dict["To Bus"],
@@ -169,8 +166,7 @@ for branch_index in branch_df.index.tolist():
                         float(this_branch_dict["Cont Rating"]))
     branch_dict[new_branch.ID] = new_branch
 
-for timeseries_pointer_index in timeseries_pointer_df.index.tolist():
-    this_timeseries_pointer_dict = timeseries_pointer_df.loc[timeseries_pointer_index].to_dict()
+for this_timeseries_pointer_dict in timeseries_pointer_df.to_dict(orient="records"):
     new_timeseries_pointer = TimeSeriesPointer(this_timeseries_pointer_dict["Object"],
                                                this_timeseries_pointer_dict["Simulation"],
                                                this_timeseries_pointer_dict["Parameter"],
@@ -186,18 +182,22 @@ target_datetime = datetime(target_year, target_month, target_day)
 target_plus_one_datetime = target_datetime + timedelta(days=2)
 
 filtered_timeseries = {} # maps renewables generator ID to list of DateTimeValue tuples
+renewables_timeseries_df_dict = {} # keys are data file names - many generators share one file
 
 for gen_name, gen_spec in generator_dict.items():
     if gen_spec.Fuel == "Solar" or gen_spec.Fuel == "Wind" or gen_spec.Fuel == "Hydro":
         if (gen_spec.ID, "DAY_AHEAD") not in timeseries_pointer_dict:
             print("***WARNING - No timeseries pointer entry found for generator=%s" % gen_spec.ID)
         else:
-            print("Time series for generator=%s will be loaded from file=%s" % (gen_spec.ID, timeseries_pointer_dict[(gen_spec.ID,"DAY_AHEAD")].DataFile))
-            renewables_timeseries_df = pd.read_table(timeseries_pointer_dict[(gen_spec.ID,"DAY_AHEAD")].DataFile,
-                                                     header=0,
-                                                     sep=',',
-                                                     parse_dates=[[0, 1, 2, 3]],
-                                                     date_parser=lambda *columns: datetime(*map(int,columns[0:3]), int(columns[3])-1))
+            data_file = timeseries_pointer_dict[(gen_spec.ID,"DAY_AHEAD")].DataFile
+            print("Time series for generator=%s will be loaded from file=%s" % (gen_spec.ID, data_file))
+            if data_file not in renewables_timeseries_df_dict:
+                renewables_timeseries_df_dict[data_file] = pd.read_table(data_file,
+                                                                         header=0,
+                                                                         sep=',',
+                                                                         parse_dates=[[0, 1, 2, 3]],
+                                                                         date_parser=lambda *columns: datetime(*map(int,columns[0:3]), int(columns[3])-1))
+            renewables_timeseries_df = renewables_timeseries_df_dict[data_file]
             this_source_timeseries_df = renewables_timeseries_df.loc[:,["Year_Month_Day_Period", gen_spec.ID]]
             this_source_timeseries_df = this_source_timeseries_df.rename(columns = {"Year_Month_Day_Period" : "DateTime"})
 
@@ -206,11 +206,8 @@ for gen_name, gen_spec in generator_dict.items():
             this_source_masked_timeseries_df = this_source_timeseries_df[start_mask & end_mask]
 
             renewables_timeseries_dict = this_source_masked_timeseries_df.to_dict(orient='split')
-            renewables_timeseries = []
-            for this_row in renewables_timeseries_dict["data"]:
-                renewables_timeseries.append(DateTimeValue(this_row[0],
-                                                           float(this_row[1])))
-            filtered_timeseries[gen_spec.ID] = renewables_timeseries
+            filtered_timeseries[gen_spec.ID] = [DateTimeValue(this_row[0], float(this_row[1]))
+                                                for this_row in renewables_timeseries_dict["data"]]
 
 load_timeseries_spec = timeseries_pointer_dict[("Load","DAY_AHEAD")]
 load_timeseries_df = pd.read_table(load_timeseries_spec.DataFile,
@@ -223,12 +220,11 @@ start_mask = load_timeseries_df["DateTime"] >= target_datetime
 end_mask = load_timeseries_df["DateTime"] < target_plus_one_datetime
 masked_load_timeseries_df = load_timeseries_df[start_mask & end_mask]
 load_dict = masked_load_timeseries_df.to_dict(orient='split')
-load_timeseries = []
-for load_row in load_dict["data"]:
-    load_timeseries.append(Load(load_row[0],
-                                float(load_row[1]),
-                                float(load_row[2]),
-                                float(load_row[3])))
+load_timeseries = [Load(load_row[0],
+                        float(load_row[1]),
+                        float(load_row[2]),
+                        float(load_row[3]))
+                   for load_row in load_dict["data"]]
 
 unit_on_time_df = pd.read_table("../FormattedData/PLEXOS/PLEXOS_Solution/DAY_AHEAD Solution Files/noTX/on_time_7.12.csv",
                                 header=0,
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import matplotlib.pyplot as mpl
 import numpy as np
@@ -11,11 +12,14 @@ import pandapower.plotting as plt
 DIGITS = 5
 miles_to_km = 1.60934
 baseMVA = 100.
+source_path = os.path.join("..", "..", "SourceData")
 
 
+@lru_cache(maxsize=None)
 def _read_csv(table):
-    start_path = os.path.join("..", "..", "SourceData")
-    return pd.read_csv(os.path.join(start_path, table + ".csv"))
+    # bus.csv and branch.csv are read both when building the ppc and when adding the
+    # additional information; parse each table once (callers only read from the frame)
+    return pd.read_csv(os.path.join(source_path, table + ".csv"))
 
 
 def plot_net(net, ax=None):
@@ -56,7 +60,7 @@ def plot_net(net, ax=None):
 def create_buses():
     busdata = _read_csv("bus")
     buses = np.zeros((len(busdata), 15), dtype=float)
-    for ind, (i, b) in enumerate(busdata.iterrows()):
+    for ind, b in enumerate(busdata.to_dict(orient="records")):
         buses[ind, 0] = b['Bus ID']
         if b['Bus Type'] == 'PQ':
             buses[ind, 1] = 1
@@ -84,7 +88,7 @@ def create_buses():
 def create_branches():
     branchdata = _read_csv("branch")
     branches = np.zeros((len(branchdata), 14), dtype=float)
-    for ind, (i, b) in enumerate(branchdata.iterrows()):
+    for ind, b in enumerate(branchdata.to_dict(orient="records")):
         branches[ind, 0] = int(b['From Bus'])
         branches[ind, 1] = int(b['To Bus'])
         branches[ind, 2] = b['R']
@@ -105,7 +109,7 @@ def create_branches():
 def create_gens():
     gendata = _read_csv("gen")
     gens = np.zeros((len(gendata), 21), dtype=float)
-    for ind, (i, g) in enumerate(gendata.iterrows()):
+    for ind, g in enumerate(gendata.to_dict(orient="records")):
         gens[ind, 0] = g['Bus ID']
         gens[ind, 1] = g['MW Inj']
         gens[ind, 2] = g['MVAR Inj']